@@ -231,7 +231,9 @@ def _extract_protected_values(self, messages: list[Message]) -> dict[str, str]:
         remaining_keys = set(self._output_keys)
 
         for msg in reversed(messages):
-            if msg.role != "assistant" or not remaining_keys:
+            if not remaining_keys:
+                break
+            if msg.role != "assistant":
                 continue
 
             for key in list(remaining_keys):
@@ -508,9 +508,9 @@ def to_summary(self, node_spec: Any = None) -> str:
             # Fallback: simple key-value listing
             parts = [f"✓ Completed with {len(self.output)} outputs:"]
             for key, value in list(self.output.items())[:5]:  # Limit to 5 keys
-                value_str = str(value)[:100]
-                if len(str(value)) > 100:
-                    value_str += "..."
+                value_str = str(value)
+                if len(value_str) > 100:
+                    value_str = value_str[:100] + "..."
                 parts.append(f"  • {key}: {value_str}")
             return "\n".join(parts)
 
@@ -547,9 +547,9 @@ def to_summary(self, node_spec: Any = None) -> str:
             # Fallback on error
             parts = [f"✓ Completed with {len(self.output)} outputs:"]
             for key, value in list(self.output.items())[:3]:
-                value_str = str(value)[:80]
-                if len(str(value)) > 80:
-                    value_str += "..."
+                value_str = str(value)
+                if len(value_str) > 80:
+                    value_str = value_str[:80] + "..."
                 parts.append(f"  • {key}: {value_str}")
             return "\n".join(parts)
 
@@ -870,9 +870,9 @@ def executor(tool_use: ToolUse) -> ToolResult:
                     logger.info(f"         🔧 Tool call: {tool_use.name}({args})")
                     result = self.tool_executor(tool_use)
                     # Truncate long results
-                    result_str = str(result.content)[:150]
-                    if len(str(result.content)) > 150:
-                        result_str += "..."
+                    result_str = str(result.content)
+                    if len(result_str) > 150:
+                        result_str = result_str[:150] + "..."
                     logger.info(f"         ✓ Tool result: {result_str}")
                     return result
 
@@ -7,6 +7,20 @@
 
 from framework.llm.provider import LLMProvider, LLMResponse, Tool, ToolResult, ToolUse
 
+# Hints in a system prompt that suggest structured (JSON) output is expected.
+# One case-insensitive pass instead of lowercasing and scanning per keyword.
+_JSON_HINT_RE = re.compile(r"json|output_keys", re.IGNORECASE)
+
+# Output-key extraction patterns, compiled once at import
+_OUTPUT_KEYS_RE = re.compile(r"output_keys:\s*\[(.*?)\]", re.IGNORECASE)
+_KEYS_RE = re.compile(r"(?:keys|with keys):\s*([a-zA-Z0-9_,\s]+)", re.IGNORECASE)
+_JSON_OBJECT_KEY_RE = re.compile(r'\{[^}]*"([a-zA-Z0-9_]+)":\s*')
+_JSON_KEY_RE = re.compile(r'"([a-zA-Z0-9_]+)":\s*')
+
+# Static responses, built once instead of on every call
+_FALLBACK_JSON_RESPONSE = json.dumps({"result": "mock_result_value"}, indent=2)
+_TEXT_RESPONSE = "This is a mock response for testing purposes."
+
 
 class MockLLMProvider(LLMProvider):
     """
@@ -53,24 +67,24 @@ def _extract_output_keys(self, system: str) -> list[str]:
         keys = []
 
         # Pattern 1: output_keys: [key1, key2]
-        match = re.search(r"output_keys:\s*\[(.*?)\]", system, re.IGNORECASE)
+        match = _OUTPUT_KEYS_RE.search(system)
         if match:
             keys_str = match.group(1)
             keys = [k.strip().strip("\"'") for k in keys_str.split(",")]
             return keys
 
         # Pattern 2: "keys: key1, key2" or "Generate JSON with keys: key1, key2"
-        match = re.search(r"(?:keys|with keys):\s*([a-zA-Z0-9_,\s]+)", system, re.IGNORECASE)
+        match = _KEYS_RE.search(system)
         if match:
             keys_str = match.group(1)
             keys = [k.strip() for k in keys_str.split(",") if k.strip()]
             return keys
 
         # Pattern 3: Look for JSON schema in system prompt
-        match = re.search(r'\{[^}]*"([a-zA-Z0-9_]+)":\s*', system)
+        match = _JSON_OBJECT_KEY_RE.search(system)
         if match:
             # Found at least one key in a JSON-like structure
-            all_matches = re.findall(r'"([a-zA-Z0-9_]+)":\s*', system)
+            all_matches = _JSON_KEY_RE.findall(system)
             if all_matches:
                 return list(set(all_matches))
 
@@ -101,10 +115,10 @@ def _generate_mock_response(
                 return json.dumps(mock_data, indent=2)
             else:
                 # Fallback: generic mock response
-                return json.dumps({"result": "mock_result_value"}, indent=2)
+                return _FALLBACK_JSON_RESPONSE
         else:
             # Plain text mock response
-            return "This is a mock response for testing purposes."
+            return _TEXT_RESPONSE
 
     def complete(
         self,
@@ -164,7 +178,7 @@ def complete_with_tools(
         """
         # In mock mode, we don't execute tools - just return a final response
         # Try to generate JSON if the system prompt suggests structured output
-        json_mode = "json" in system.lower() or "output_keys" in system.lower()
+        json_mode = _JSON_HINT_RE.search(system) is not None
 
         content = self._generate_mock_response(system=system, json_mode=json_mode)
 